@@ -52,10 +52,19 @@ def run() -> None:
             accept_multiple_files=True,
         )
         if files:
-            datasets = load_data(files)
+            row_limit = st.number_input(
+                "Row limit (0 = no limit):",
+                min_value=0,
+                value=0,
+                step=10_000,
+            )
+            datasets = load_data(files, row_limit=row_limit or None)
             name = st.selectbox("Select a dataset:", datasets.keys())
             if name:
                 st.session_state["data"] = (name, datasets[name])
+                st.session_state["numeric_columns"] = list(
+                    datasets[name].select_dtypes(include=["number"]).columns
+                )
 
     st.markdown(
         (
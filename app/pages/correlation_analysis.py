@@ -5,8 +5,9 @@ A Correlation Analysis Page
 import pandas as pd
 import streamlit as st
 from utils import (  # pylint: disable=import-error
-    plot_correlation_heatmap,
-    plot_scatter_matrix,
+    correlation_heatmap_figure,
+    correlation_matrix,
+    scatter_matrix_figure,
 )
 
 if "data" in st.session_state:
@@ -32,7 +33,7 @@ if "data" in st.session_state:
 
     st.write("#### Data Visualization")
 
-    numeric_columns = list(dataset.select_dtypes(include=["number"]).columns)
+    numeric_columns = st.session_state["numeric_columns"]
 
     input_cols = st.columns(2)
     plot_cols = st.columns(2)
@@ -43,29 +44,38 @@ if "data" in st.session_state:
         period = st.selectbox(
             "Period:", ["Daily", "Weekly", "Monthly"], index=1
         )
+        mode = st.radio(
+            "Rendering mode:", ["Points", "Binned"], horizontal=True
+        )
 
     if len(columns) > 0:
+        sub = dataset[columns]
         with plot_cols[0]:
-            cplt = plot_correlation_heatmap(
-                dataset,
+            cplt = correlation_heatmap_figure(
+                sub,
                 columns=columns,
+                corr_matrix=correlation_matrix(sub, columns),
                 figsize=(10, 5),
             )
             st.pyplot(
                 cplt,
                 use_container_width=False,
             )
-            cplt.clf()
 
         with plot_cols[1]:
-            splt = plot_scatter_matrix(
-                dataset,
+            plot_df = (
+                sub
+                if len(sub) <= 5000
+                else sub.sample(5000, random_state=0).sort_index()
+            )
+            splt = scatter_matrix_figure(
+                plot_df,
                 columns=columns,
                 resample_period=period[0],
                 figsize=(10, 5),
+                binned=mode == "Binned",
             )
             st.pyplot(
                 splt,
                 use_container_width=False,
             )
-            splt.clf()
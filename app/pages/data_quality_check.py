@@ -2,12 +2,14 @@
 Data Quality Checking Page
 """
 
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from utils import (  # pylint: disable=import-error); isort: skip
-    plot_entries,
-    report_null_columns,
+    entries_figure,
+    null_report,
 )
 
 if "data" in st.session_state:
@@ -32,11 +34,11 @@ if "data" in st.session_state:
     )
 
     st.write("#### Missing Columns")
-    st.table(report_null_columns(dataset))
+    st.table(null_report(dataset))
 
     st.write("#### Data Visualization")
 
-    numeric_columns = list(dataset.select_dtypes(include=["number"]).columns)
+    numeric_columns = st.session_state["numeric_columns"]
 
     input_cols = st.columns(1)
     plot_cols = st.columns(2)
@@ -45,20 +47,41 @@ if "data" in st.session_state:
         columns = st.multiselect("Columns", numeric_columns)
 
     if len(columns) > 0:
-        plt = plot_entries(
-            dataset,
+        eplt = entries_figure(
+            dataset[columns],
             columns=columns,
             figsize=(10, 5),
             bar_width=0.1 * len(columns),
         )
         with plot_cols[0]:
             st.pyplot(
-                plt,
+                eplt,
                 use_container_width=False,
             )
-            plt.clf()
         with plot_cols[1]:
-            st.pyplot(
-                dataset[columns].boxplot(figsize=(10, 5)).get_figure(),
-                clear_figure=True,
-            )
+            stats = []
+            for column in columns:
+                values = dataset[column].dropna().to_numpy()
+                if values.size == 0:
+                    continue
+                low, q1, med, q3, high = np.percentile(
+                    values,
+                    [0, 25, 50, 75, 100],
+                )
+                stats.append(
+                    {
+                        "label": column,
+                        "whislo": low,
+                        "q1": q1,
+                        "med": med,
+                        "q3": q3,
+                        "whishi": high,
+                        "fliers": [],
+                    }
+                )
+            if stats:
+                bfig, bax = plt.subplots(figsize=(10, 5))
+                bax.bxp(stats, showfliers=False)
+                st.pyplot(bfig, clear_figure=True)
+            else:
+                st.info("The selected columns have no data to plot.")
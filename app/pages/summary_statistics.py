@@ -4,6 +4,10 @@ A Summary Statistics Page
 
 import pandas as pd
 import streamlit as st
+from utils import (  # pylint: disable=import-error
+    describe_data,
+    resample_aggregations,
+)
 
 if "data" in st.session_state:
     name: str = st.session_state.data[0]
@@ -30,7 +34,7 @@ if "data" in st.session_state:
     st.write("##### Dataset")
     st.dataframe(dataset, use_container_width=True)
     st.write("##### Description")
-    st.dataframe(dataset.describe(), use_container_width=True)
+    st.dataframe(describe_data(dataset), use_container_width=True)
 
     st.write("#### Data Visualization")
     cols = st.columns(2)
@@ -46,7 +50,9 @@ if "data" in st.session_state:
         )
 
     st.write(aggregation_method)
-    data = getattr(
-        dataset.resample(f"{period}D"), aggregation_method.lower()
-    )()
+    data = resample_aggregations(dataset, period).xs(
+        aggregation_method.lower(), axis=1, level=1
+    )
+    if len(data) > 2000:
+        data = data.iloc[:: len(data) // 2000]
     st.line_chart(data)
@@ -2,28 +2,29 @@
 Helper Module Init
 """
 
-import importlib
 import pathlib
 import sys
 
 sys.path.append(str(pathlib.Path(__file__).parent.parent.parent.absolute()))
 
-
-from notebooks.utils import (  # noqa: E402
-    plot_correlation_heatmap,
-    plot_entries,
-    plot_scatter_matrix,
-    report_null_columns,
+from .utils import (  # noqa: E402
+    correlation_heatmap_figure,
+    correlation_matrix,
+    describe_data,
+    entries_figure,
+    load_data,
+    null_report,
+    resample_aggregations,
+    scatter_matrix_figure,
 )
 
-from .utils import load_data  # noqa: E402
-
-importlib.reload(sys.modules["notebooks"])
-
 __all__ = [
+    "correlation_heatmap_figure",
+    "correlation_matrix",
+    "describe_data",
+    "entries_figure",
     "load_data",
-    "plot_correlation_heatmap",
-    "plot_entries",
-    "plot_scatter_matrix",
-    "report_null_columns",
+    "null_report",
+    "resample_aggregations",
+    "scatter_matrix_figure",
 ]
@@ -2,34 +2,310 @@
 A helper module for dashboard for Solar Farm Insight
 """
 
+import concurrent.futures
+import hashlib
+import io
+import pathlib
+import tempfile
+
 import pandas as pd
+import streamlit as st
+
+CHUNK_SIZE = 100_000
+CACHE_DIR = pathlib.Path(tempfile.gettempdir()) / "sfi_cache"
+
+
+def _hash_dataframe(frame) -> tuple:
+    """
+    Hash a DataFrame by shape, columns, and a bounded row sample
+
+    Args:
+        frame (pd.DataFrame): The frame to hash
+
+    Returns (tuple):
+    """
+    return (
+        frame.shape,
+        tuple(frame.columns),
+        pd.util.hash_pandas_object(frame.head(1000)).values.tobytes(),
+    )
+
+
+def process_names(file_names) -> list:
+    """
+    Process the names of the files to be displayed in the dashboard
+
+    Args:
+        file_names (list): The names of the files
+
+    Returns (list):
+    """
+    return (
+        pd.Series(file_names)
+        .str.replace(".csv", "", regex=False)
+        .str.replace("_", " ", regex=False)
+        .str.title()
+        .tolist()
+    )
+
+
+def downcast_numeric(frame) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the smallest sufficient dtype
+
+    Args:
+        frame (pd.DataFrame): The frame to downcast
+
+    Returns (pd.DataFrame):
+    """
+    for column in frame.select_dtypes(include=["float"]).columns:
+        frame[column] = pd.to_numeric(frame[column], downcast="float")
+    for column in frame.select_dtypes(include=["integer"]).columns:
+        frame[column] = pd.to_numeric(frame[column], downcast="integer")
+    return frame
 
 
-def process_name(name) -> str:
+def read_csv(buffer, row_limit=None) -> pd.DataFrame:
     """
-    Process the name of the file to be displayed in the dashboard
+    Read a CSV buffer into a timestamp-indexed DataFrame
 
     Args:
-        name (str): The name of the file
+        buffer (io.BytesIO): A buffer holding the raw CSV bytes
+        row_limit (int): Stop reading after this many rows (optional)
 
-    Returns (str):
+    Returns (pd.DataFrame):
     """
-    return name.replace(".csv", "").replace("_", " ").title()
+    if row_limit:
+        chunks = []
+        loaded = 0
+        with pd.read_csv(
+            buffer,
+            parse_dates=["Timestamp"],
+            index_col="Timestamp",
+            engine="c",
+            low_memory=False,
+            cache_dates=True,
+            chunksize=CHUNK_SIZE,
+        ) as reader:
+            for chunk in reader:
+                chunks.append(chunk)
+                loaded += len(chunk)
+                if loaded >= row_limit:
+                    break
+        return downcast_numeric(pd.concat(chunks).iloc[:row_limit])
+    try:
+        frame = pd.read_csv(
+            buffer,
+            parse_dates=["Timestamp"],
+            index_col="Timestamp",
+            engine="pyarrow",
+        )
+    except (ImportError, ValueError):
+        buffer.seek(0)
+        frame = pd.read_csv(
+            buffer,
+            parse_dates=["Timestamp"],
+            index_col="Timestamp",
+            engine="c",
+            low_memory=False,
+            cache_dates=True,
+        )
+    return downcast_numeric(frame)
+
+
+@st.cache_data(show_spinner=False)
+def _load_payload(payload, row_limit=None) -> dict:
+    """
+    Load the datasets from raw CSV bytes
+
+    Args:
+        payload (list): A list of (name, data) tuples holding the file
+                        name and the raw CSV bytes
+        row_limit (int): Load at most this many rows per file (optional)
+
+    Returns (dict):
+    """
+    display_names = process_names([file_name for file_name, _ in payload])
+
+    def parse(data):
+        digest = hashlib.sha256(data).hexdigest()
+        path = CACHE_DIR / f"{digest}-{row_limit or 0}.parquet"
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except (ImportError, OSError):
+                pass
+        frame = read_csv(io.BytesIO(data), row_limit=row_limit)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            frame.to_parquet(path)
+        except (ImportError, OSError):
+            pass
+        return frame
+
+    if len(payload) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(payload))
+        ) as executor:
+            frames = list(executor.map(parse, (data for _, data in payload)))
+    else:
+        frames = [parse(data) for _, data in payload]
+    return dict(zip(display_names, frames))
 
 
-def load_data(files) -> dict:
+def load_data(files, row_limit=None) -> dict:
     """
     Load the data from the uploaded files
 
+    Streamlit keeps the read position of an UploadedFile across reruns,
+    so each buffer is rewound before its bytes are taken.
+
     Args:
         files (list): A list of uploaded files
+        row_limit (int): Load at most this many rows per file (optional)
 
     Returns (dict):
     """
-    names = {}
+    payload = []
     for file in files:
-        name = process_name(file.name)
-        names[name] = pd.read_csv(
-            file, parse_dates=["Timestamp"], index_col="Timestamp"
-        )
-    return names
+        file.seek(0)
+        payload.append((file.name, file.getvalue()))
+    return _load_payload(payload, row_limit=row_limit)
+
+
+@st.cache_data(show_spinner=False)
+def describe_data(dataset) -> pd.DataFrame:
+    """
+    Describe the dataset, memoized per dataset
+
+    Args:
+        dataset (pd.DataFrame): The dataset to describe
+
+    Returns (pd.DataFrame):
+    """
+    return dataset.describe()
+
+
+@st.cache_data(show_spinner=False)
+def resample_aggregations(dataset, period) -> pd.DataFrame:
+    """
+    Resample the dataset and compute every aggregation method in a
+    single pass, memoized per dataset and period
+
+    Args:
+        dataset (pd.DataFrame): The dataset to resample
+        period (int): The resampling period in days
+
+    Returns (pd.DataFrame):
+    """
+    return dataset.resample(f"{period}D").agg(["mean", "median", "min", "max"])
+
+
+@st.cache_data(show_spinner=False)
+def correlation_matrix(dataset, columns) -> pd.DataFrame:
+    """
+    Compute the correlation matrix, memoized per dataset and columns
+
+    Args:
+        dataset (pd.DataFrame): The dataset to correlate
+        columns (list): The columns to include
+
+    Returns (pd.DataFrame):
+    """
+    from notebooks.utils import (  # pylint: disable=import-outside-toplevel
+        compute_correlation_matrix,
+    )
+
+    return compute_correlation_matrix(dataset, columns)
+
+
+@st.cache_data(show_spinner=False)
+def null_report(dataset) -> dict:
+    """
+    Report columns with NULL values, memoized per dataset
+
+    Args:
+        dataset (pd.DataFrame): The dataset to report on
+
+    Returns (dict):
+    """
+    from notebooks.utils import (  # pylint: disable=import-outside-toplevel
+        report_null_columns,
+    )
+
+    return report_null_columns(dataset)
+
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_dataframe})
+def correlation_heatmap_figure(
+    dataset, columns, corr_matrix=None, figsize=(10, 5)
+):
+    """
+    Build the correlation heatmap figure, reused across reruns
+
+    Args:
+        dataset (pd.DataFrame): The dataset to plot
+        columns (list): The columns to include
+        corr_matrix (pd.DataFrame): A precomputed correlation matrix
+        figsize (tuple): Figure size as (width, height)
+
+    Returns (matplotlib.figure.Figure):
+    """
+    from notebooks.utils import (  # pylint: disable=import-outside-toplevel
+        plot_correlation_heatmap,
+    )
+
+    return plot_correlation_heatmap(
+        dataset, columns=columns, corr_matrix=corr_matrix, figsize=figsize
+    )
+
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_dataframe})
+def scatter_matrix_figure(
+    dataset, columns, resample_period="D", figsize=(10, 5), binned=False
+):
+    """
+    Build the scatter matrix figure, reused across reruns
+
+    Args:
+        dataset (pd.DataFrame): The dataset to plot
+        columns (list): The columns to include
+        resample_period (str): The resampling period
+        figsize (tuple): Figure size as (width, height)
+        binned (bool): Render cells as 2-D histograms
+
+    Returns (matplotlib.figure.Figure):
+    """
+    from notebooks.utils import (  # pylint: disable=import-outside-toplevel
+        plot_scatter_matrix,
+    )
+
+    return plot_scatter_matrix(
+        dataset,
+        columns=columns,
+        resample_period=resample_period,
+        figsize=figsize,
+        binned=binned,
+    )
+
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_dataframe})
+def entries_figure(dataset, columns, figsize=(10, 5), bar_width=0.1):
+    """
+    Build the entry distribution figure, reused across reruns
+
+    Args:
+        dataset (pd.DataFrame): The dataset to plot
+        columns (list): The columns to include
+        figsize (tuple): Figure size as (width, height)
+        bar_width (float): The width of the stacked bars
+
+    Returns (matplotlib.figure.Figure):
+    """
+    from notebooks.utils import (  # pylint: disable=import-outside-toplevel
+        plot_entries,
+    )
+
+    return plot_entries(
+        dataset, columns=columns, figsize=figsize, bar_width=bar_width
+    )
@@ -3,14 +3,35 @@ Helper functions for the notebooks.
 """
 
 import math
+import os
 
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-from statsmodels.tsa.seasonal import seasonal_decompose
+from scipy import signal
 from windrose import WindroseAxes
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy covers the same math
+    ne = None
+
+# Rendering to file does not need an interactive backend, and Agg is
+# much cheaper to set up per figure.
+if os.environ.get("SOLARFARM_FAST_PLOTS"):
+    matplotlib.use("Agg")
+
+plt.rcParams["path.simplify"] = True
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10_000
+
+# Fixed binning shared by the RH and wind-direction helpers
+_RH_EDGES = np.array([30.0, 60.0])
+_RH_LABELS = ["Low", "Medium", "High"]
+_WD_BINS = np.arange(0, 360, 10, dtype=float)
+
 
 def report_null_columns(df):
     """
@@ -23,12 +44,12 @@ def report_null_columns(df):
         dict: A dictionary with column names as keys
               and count of NULL values as values.
     """
-    null_report = {
-        col: int(df[col].isnull().sum())
-        for col in df.columns
-        if df[col].isnull().sum() > 0
+    null_counts = df.isna().sum()
+    return {
+        column: int(count)
+        for column, count in null_counts.items()
+        if count > 0
     }
-    return null_report
 
 
 def plot_statistical_summary(
@@ -72,10 +93,17 @@ def plot_statistical_summary(
     )
     axes = axes.flatten()
 
+    agg_df = dataframe.resample(resample_period, on=time_column).agg(
+        aggregation_methods
+    )
+
+    handles, labels = [], []
     for idx, method in enumerate(aggregation_methods):
-        getattr(
-            dataframe.resample(resample_period, on=time_column), method
-        )().plot(ax=axes[idx], legend=False)
+        agg_df.xs(method, axis=1, level=-1).plot(ax=axes[idx], legend=False)
+
+        if idx == 0:
+            handles = list(axes[idx].get_lines())
+            labels = [line.get_label() for line in handles]
 
         axes[idx].set_title(f"{title} ({method.capitalize()})")
         axes[idx].set_xlabel(xlabel)
@@ -85,9 +113,7 @@ def plot_statistical_summary(
         if idx >= len(aggregation_methods):
             ax.axis("off")
 
-    fig.legend(
-        *axes[idx].get_legend_handles_labels(), loc="upper center", ncol=5
-    )
+    fig.legend(handles, labels, loc="upper center", ncol=5)
 
     plt.tight_layout(rect=[0, 0, 1, 0.95])
     plt.show()
@@ -132,25 +158,31 @@ def plot_histogram_with_percentiles(
     # List to hold the labels for the common legend
     handles, labels = [], []
 
+    line_colors = plt.cm.viridis(  # pylint: disable=no-member
+        np.linspace(0.0, 1.0, len(percentiles))
+    )
+
+    values_block = data[columns].to_numpy()
+    percentile_block = np.nanpercentile(values_block, percentiles, axis=0)
+
     for i, column in enumerate(columns):
-        values = data[column]
-        percentile_values = np.percentile(values, percentiles)
+        values = values_block[:, i]
+        percentile_values = percentile_block[:, i]
 
         axes[i].hist(
             values, bins=bins, alpha=0.7, color="blue", edgecolor="black"
         )
-        for p, val in zip(percentiles, percentile_values):
+        for k, (p, val) in enumerate(zip(percentiles, percentile_values)):
             line = axes[i].axvline(
                 x=val,
-                color=plt.cm.viridis(
-                    np.random.rand()
-                ),  # pylint: disable=no-member
+                color=line_colors[k],
                 linestyle="--",
                 label=f"{p}th: {val:.2f}",
             )
-            # Collect handle and label for the legend
-            handles.append(line)
-            labels.append(f"{p}th: {val:.2f}")
+            # Collect one legend entry per percentile, not per line
+            if i == 0:
+                handles.append(line)
+                labels.append(f"{p}th percentile")
 
         axes[i].set_title(f"Histogram of {column}")
         axes[i].set_xlabel(column)
@@ -182,22 +214,19 @@ def plot_entries(data, columns, figsize=(12, 8), bar_width=0.1):
     Returns:
         None
     """
-    total_counts = [len(data[col]) for col in columns]
-    negative_counts = [np.sum(data[col] < 0) for col in columns]
-    zero_counts = [np.sum(data[col] == 0) for col in columns]
-    positive_counts = [np.sum(data[col] > 0) for col in columns]
-
-    negative_percent = [
-        count / total * 100
-        for count, total in zip(negative_counts, total_counts)
-    ]
-    zero_percent = [
-        count / total * 100 for count, total in zip(zero_counts, total_counts)
-    ]
-    positive_percent = [
-        count / total * 100
-        for count, total in zip(positive_counts, total_counts)
-    ]
+    negative_percent = np.empty(len(columns))
+    zero_percent = np.empty(len(columns))
+    positive_percent = np.empty(len(columns))
+
+    for i, col in enumerate(columns):
+        arr = data[col].to_numpy()
+        total = arr.size
+        arr = arr[~np.isnan(arr)]
+        sign_codes = np.sign(arr).astype(np.int8) + 1
+        counts = np.bincount(sign_codes, minlength=3)
+        negative_percent[i], zero_percent[i], positive_percent[i] = (
+            counts[:3] / total * 100
+        )
 
     x = np.arange(len(columns))
 
@@ -220,7 +249,7 @@ def plot_entries(data, columns, figsize=(12, 8), bar_width=0.1):
     plt.bar(
         x,
         positive_percent,
-        bottom=np.array(negative_percent) + np.array(zero_percent),
+        bottom=negative_percent + zero_percent,
         color="blue",
         label="Positive Values",
         width=bar_width,
@@ -266,24 +295,34 @@ def plot_trends(
     """
 
     nrows = -(-len(columns) // ncols)
-    plt.figure(figsize=figsize)
+    _, axes = plt.subplots(nrows, ncols, figsize=figsize)
+    axes = np.array(axes).flatten()
+
+    x_values = np.asarray(
+        getattr(
+            dataframe.index,
+            {"m": "month", "d": "day", "h": "hour"}[period[0].lower()],
+        )
+    )
+    years = np.asarray(dataframe.index.year)
 
     for i, var in enumerate(columns):
-        plt.subplot(nrows, ncols, i + 1)
         sns.barplot(
             data=dataframe,
-            x={
-                "m": dataframe.index.month,
-                "d": dataframe.index.day,
-                "h": dataframe.index.hour,
-            }[period[0].lower()],
+            x=x_values,
             y=var,
-            hue=dataframe.index.year,
+            hue=years,
+            ax=axes[i],
+        )
+        axes[i].set_title(f"{title_prefix} - {var} by {period}")
+        axes[i].set_xlabel(period)
+        axes[i].set_ylabel(var)
+        axes[i].legend(
+            title="Year", bbox_to_anchor=(1.05, 1), loc="upper left"
         )
-        plt.title(f"{title_prefix} - {var} by {period}")
-        plt.xlabel(period)
-        plt.ylabel(var)
-        plt.legend(title="Year", bbox_to_anchor=(1.05, 1), loc="upper left")
+
+    for j in range(len(columns), len(axes)):
+        axes[j].axis("off")
 
     plt.tight_layout()
     plt.show()
@@ -311,15 +350,38 @@ def plot_seasonal_decomposition(
     _, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
     axes = axes.flatten()
 
-    for i, column in enumerate(columns):
+    # Additive decomposition for every column at once: one convolution
+    # for the trends, one phase-mean for the seasonal profiles.
+    values = data[columns].to_numpy(dtype=np.float32)
+    kernel = np.full((period, 1), 1.0 / period, dtype=np.float32)
+    trend = signal.oaconvolve(values, kernel, axes=0, mode="same")
+    # The centered moving average is only valid where the kernel fully
+    # overlaps the series; blank the zero-padded edges like statsmodels.
+    half = period // 2
+    if half:
+        trend[:half] = np.nan
+        trend[-half:] = np.nan
+    detrended = values - trend
+
+    n_cycles = -(-len(values) // period)
+    padded = np.pad(
+        detrended,
+        ((0, n_cycles * period - len(values)), (0, 0)),
+        constant_values=np.nan,
+    )
+    profile = np.nanmean(
+        padded.reshape(n_cycles, period, len(columns)), axis=0
+    )
+    profile -= profile.mean(axis=0)
+    seasonal = np.tile(profile, (n_cycles, 1))[: len(values)]
+    resid = detrended - seasonal
 
-        decomposition = seasonal_decompose(
-            data[column], model="additive", period=period
+    for i, column in enumerate(columns):
+        axes[i].plot(data.index, trend[:, i], label="Trend", color="blue")
+        axes[i].plot(
+            data.index, seasonal[:, i], label="Seasonal", color="green"
         )
-
-        axes[i].plot(decomposition.trend, label="Trend", color="blue")
-        axes[i].plot(decomposition.seasonal, label="Seasonal", color="green")
-        axes[i].plot(decomposition.resid, label="Residual", color="red")
+        axes[i].plot(data.index, resid[:, i], label="Residual", color="red")
         axes[i].set_title(f"Seasonal Decomposition of {column}")
         axes[i].legend()
 
@@ -353,21 +415,41 @@ def plot_cleaning_impact(
         nrows=nrows, ncols=ncols, figsize=figsize, constrained_layout=True
     )
 
+    sorted_data = (
+        data.sort_values(time_column)
+        if time_column is not None
+        else data.sort_index()
+    )
+    groups = []
+    for status, subset in sorted_data.groupby("Cleaning"):
+        if time_column is None and isinstance(subset.index, pd.DatetimeIndex):
+            # Minute-level readings exceed what the renderer can show;
+            # an hourly mean keeps the trend with far fewer segments.
+            resampled = subset.resample("1h").mean(numeric_only=True)
+            if len(resampled) < len(subset):
+                subset = resampled
+        groups.append(
+            (
+                status,
+                subset,
+                (
+                    subset[time_column].to_numpy()
+                    if time_column is not None
+                    else subset.index.to_numpy()
+                ),
+            )
+        )
+
     for i, column in enumerate(columns):
         sns.boxplot(ax=axes[i, 0], data=data, x="Cleaning", y=column)
         axes[i, 0].set_title(f"Efect: {column}")
         axes[i, 0].set_xlabel("Cleaning (0 = Before, 1 = After)")
         axes[i, 0].set_ylabel("Readings")
 
-        for status in data["Cleaning"].unique():
-            subset = data[data["Cleaning"] == status]
+        for status, subset, time_values in groups:
             axes[i, 1].plot(
-                (
-                    subset[time_column]
-                    if time_column is not None
-                    else subset.index
-                ),
-                subset[column],
+                time_values,
+                subset[column].to_numpy(),
                 label=f"Cleaning {status}",
             )
         axes[i, 1].set_title(f"Trend Plot: {column}")
@@ -380,27 +462,68 @@ def plot_cleaning_impact(
     plt.show()
 
 
-def plot_correlation_heatmap(data, columns, *, figsize=(8, 6)):
+def compute_correlation_matrix(data, columns):
+    """
+    Compute the correlation matrix for the given columns with a single
+    BLAS-backed NumPy call over complete rows.
+
+    Args:
+        data (pd.DataFrame): The dataset containing the columns.
+        columns (list): List of column names to correlate.
+
+    Returns:
+        pd.DataFrame: The correlation matrix.
+    """
+    values = data[columns].to_numpy(dtype=np.float32)
+    complete = ~np.isnan(values).any(axis=1)
+    corr = np.corrcoef(values[complete], rowvar=False)
+    return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+def plot_correlation_heatmap(
+    data, columns, *, corr_matrix=None, figsize=(8, 6)
+):
     """
     Plot a heatmap of correlations for RH, temperature, and solar radiation.
 
     Args:
         data (pd.DataFrame): The dataset containing relevant columns.
+        corr_matrix (pd.DataFrame): A precomputed correlation matrix;
+                                    computed from `data` when omitted.
 
     Returns:
         None
     """
 
-    corr_matrix = data[columns].corr()
-    plt.figure(figsize=figsize)
-    sns.heatmap(corr_matrix, annot=True, cmap="coolwarm", fmt=".2f", cbar=True)
-    plt.title("Correlation Heatmap: " + ", ".join(columns))
+    if corr_matrix is None:
+        corr_matrix = compute_correlation_matrix(data, columns)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    image = ax.imshow(
+        corr_matrix.to_numpy(),
+        cmap="coolwarm",
+        vmin=-1,
+        vmax=1,
+        interpolation="nearest",
+        aspect="auto",
+    )
+    fig.colorbar(image, ax=ax)
+    if len(columns) <= 15:
+        for (i, j), value in np.ndenumerate(corr_matrix.to_numpy()):
+            ax.text(j, i, f"{value:.2f}", ha="center", va="center")
+    ax.set_xticks(range(len(columns)))
+    ax.set_xticklabels(columns, rotation=45)
+    ax.set_yticks(range(len(columns)))
+    ax.set_yticklabels(columns)
+    ax.set_title("Correlation Heatmap: " + ", ".join(columns))
     plt.show()
 
-    return plt.gcf()
+    return fig
 
 
-def plot_scatter_matrix(data, columns, resample_period="D", figsize=(10, 10)):
+def plot_scatter_matrix(
+    data, columns, resample_period="D", figsize=(10, 10), binned=False
+):
     """
     Plot a scatter matrix for specified columns after resampling data to the
     given period.
@@ -410,15 +533,38 @@ def plot_scatter_matrix(data, columns, resample_period="D", figsize=(10, 10)):
         columns (list): List of column names to include in the scatter matrix.
         resample_period (str): The resampling period (default: 'D' for daily).
         figsize (tuple): Figure size for the scatter matrix (default:(10, 10)).
+        binned (bool): Draw off-diagonal cells as 2-D histograms (hexbin)
+                       instead of individual points; forced for large
+                       resampled datasets.
 
     Returns:
         None
     """
-    resampled_data = data.resample(resample_period).mean()
-
-    pd.plotting.scatter_matrix(
-        resampled_data[columns], figsize=figsize, alpha=0.7
-    )
+    resampled_data = data[columns].resample(resample_period).mean()
+
+    if binned or len(resampled_data) > 20_000:
+        _, axes = plt.subplots(len(columns), len(columns), figsize=figsize)
+        axes = np.array(axes).reshape(len(columns), len(columns))
+        for i, y_col in enumerate(columns):
+            for j, x_col in enumerate(columns):
+                ax = axes[i, j]
+                if i == j:
+                    ax.hist(resampled_data[x_col].dropna(), bins=30)
+                else:
+                    cell = resampled_data[[x_col, y_col]].dropna()
+                    ax.hexbin(
+                        cell[x_col],
+                        cell[y_col],
+                        gridsize=50,
+                        cmap="viridis",
+                        mincnt=1,
+                    )
+                if i == len(columns) - 1:
+                    ax.set_xlabel(x_col)
+                if j == 0:
+                    ax.set_ylabel(y_col)
+    else:
+        pd.plotting.scatter_matrix(resampled_data, figsize=figsize, alpha=0.7)
     plt.suptitle(
         f"Scatter Matrix for {resample_period.capitalize()} Data", fontsize=16
     )
@@ -440,13 +586,25 @@ def plot_windrose_distribution(data):
         None
     """
 
-    bins = np.arange(0, 361, 10)
-    data["WD_bin"] = pd.cut(
-        data["WD"], bins=bins, labels=bins[:-1], include_lowest=True
+    wd_values = data["WD"].to_numpy()
+    wdstdev_values = data["WDstdev"].to_numpy()
+    valid = ~(np.isnan(wd_values) | np.isnan(wdstdev_values))
+    wd_codes = np.clip(
+        (wd_values[valid] // 10).astype(np.int64),
+        0,
+        _WD_BINS.size - 1,
     )
+    sums = np.bincount(
+        wd_codes, weights=wdstdev_values[valid], minlength=_WD_BINS.size
+    )
+    counts = np.bincount(wd_codes, minlength=_WD_BINS.size)
 
-    avg_wdstdev = data.groupby("WD_bin")["WDstdev"].mean().reset_index()
-    avg_wdstdev["WD_bin"] = avg_wdstdev["WD_bin"].astype(float)
+    avg_wdstdev = pd.DataFrame(
+        {
+            "WD_bin": _WD_BINS,
+            "WDstdev": np.where(counts > 0, sums / np.maximum(counts, 1), 0.0),
+        }
+    )
 
     fig = plt.figure(figsize=(18, 6))
 
@@ -493,19 +651,23 @@ def analyze_rh_impact(data, group_period="D", *, figsize=(15, 10)):
         None
     """
 
-    numeric_data = data.select_dtypes(include=["number"])
-
-    grouped_data = numeric_data.resample(group_period).mean()
-
     variables = ["TModA", "TModB", "GHI", "DNI", "DHI"]
 
-    plt.figure(figsize=figsize)
-    for i, var in enumerate(variables, 1):
+    wanted = [
+        column for column in ["RH"] + variables if column in data.columns
+    ]
+    grouped_data = data[wanted].resample(group_period).mean()
+
+    _, axes = plt.subplots(2, 3, figsize=figsize)
+    axes = axes.flatten()
+    for i, var in enumerate(variables):
         if var not in grouped_data.columns:
+            axes[i].axis("off")
             continue
 
-        plt.subplot(2, 3, i)
-        sns.scatterplot(data=grouped_data, x="RH", y=var, alpha=0.7)
+        sns.scatterplot(
+            data=grouped_data, x="RH", y=var, alpha=0.7, ax=axes[i]
+        )
         sns.regplot(
             data=grouped_data,
             x="RH",
@@ -513,10 +675,14 @@ def analyze_rh_impact(data, group_period="D", *, figsize=(15, 10)):
             scatter=False,
             color="red",
             line_kws={"linewidth": 2},
+            ax=axes[i],
         )
-        plt.title(f"{var} vs RH ({group_period} Mean)")
-        plt.xlabel("Relative Humidity (RH)")
-        plt.ylabel(var)
+        axes[i].set_title(f"{var} vs RH ({group_period} Mean)")
+        axes[i].set_xlabel("Relative Humidity (RH)")
+        axes[i].set_ylabel(var)
+
+    for j in range(len(variables), len(axes)):
+        axes[j].axis("off")
 
     plt.tight_layout()
     plt.show()
@@ -533,8 +699,11 @@ def plot_boxplot_rh_categories(data):
     Returns:
         None
     """
-    data["RH_category"] = pd.cut(
-        data["RH"], bins=[0, 30, 60, 100], labels=["Low", "Medium", "High"]
+    rh_values = data["RH"].to_numpy()
+    codes = np.searchsorted(_RH_EDGES, rh_values)
+    codes[np.isnan(rh_values)] = -1
+    data = data.assign(
+        RH_category=pd.Categorical.from_codes(codes, categories=_RH_LABELS)
     )
 
     variables = ["TModA", "TModB", "GHI", "DNI", "DHI"]
@@ -567,17 +736,49 @@ def plot_histograms(data, variables, bins=30, figsize=(15, 10)):
     ncols = 3
     nrows = -(-num_vars // ncols)
 
-    plt.figure(figsize=figsize)
-    for i, var in enumerate(variables, 1):
-        plt.subplot(nrows, ncols, i)
-        data[var].dropna().hist(bins=bins, alpha=0.7, edgecolor="black")
-        plt.title(f"Histogram of {var}")
-        plt.xlabel(var)
-        plt.ylabel("Frequency")
+    _, axes = plt.subplots(nrows, ncols, figsize=figsize)
+    axes = np.array(axes).flatten()
+    for i, var in enumerate(variables):
+        data[var].dropna().hist(
+            bins=bins, alpha=0.7, edgecolor="black", ax=axes[i]
+        )
+        axes[i].set_title(f"Histogram of {var}")
+        axes[i].set_xlabel(var)
+        axes[i].set_ylabel("Frequency")
+
+    for j in range(num_vars, len(axes)):
+        axes[j].axis("off")
+
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_outliers(dataframe, columns, figsize=(15, 6)):
+    """
+    Plot box plots for the given columns on a single axis to highlight
+    outliers.
 
+    Args:
+        dataframe (pd.DataFrame): The dataset containing the columns.
+        columns (list): List of column names to plot.
+        figsize (tuple): Size of the figure (default: (15, 6)).
+
+    Returns:
+        None
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.boxplot(
+        [dataframe[column].dropna().to_numpy() for column in columns],
+        tick_labels=columns,
+        vert=True,
+    )
+    ax.set_title("Outlier Distribution per Column")
+    ax.set_ylabel("Value")
     plt.tight_layout()
     plt.show()
 
+    return fig
+
 
 def calculate_z_scores(data, columns, threshold=3):
     """
@@ -592,17 +793,33 @@ def calculate_z_scores(data, columns, threshold=3):
                             (default: 3).
 
     Returns:
-        pd.DataFrame: DataFrame with additional columns for Z-scores and flags.
-    """
-    z_score_results = data.copy()
-
-    for column in columns:
-        z_scores = (data[column] - data[column].mean()) / data[column].std()
-        z_score_results[f"{column}_zscore"] = z_scores
-
-        z_score_results[f"{column}_flagged"] = np.abs(z_scores) > threshold
+        pd.DataFrame: DataFrame with additional columns for Z-scores and
+                      flags. The original columns share memory with
+                      `data`, so mutate either frame with care.
+    """
+    values = data[columns].to_numpy(dtype=np.float64)
+    means = np.nanmean(values, axis=0)
+    stds = np.nanstd(values, axis=0, ddof=1)
+
+    if ne is not None:
+        z_values = ne.evaluate("(values - means) / stds")
+        flag_values = ne.evaluate("abs(z_values) > threshold")
+    else:
+        z_values = (values - means) / stds
+        flag_values = np.abs(z_values) > threshold
+
+    z_scores = pd.DataFrame(
+        z_values,
+        index=data.index,
+        columns=[f"{column}_zscore" for column in columns],
+    )
+    flagged = pd.DataFrame(
+        flag_values,
+        index=data.index,
+        columns=[f"{column}_flagged" for column in columns],
+    )
 
-    return z_score_results
+    return pd.concat([data, z_scores, flagged], axis=1, copy=False)
 
 
 def plot_bubble_chart(
@@ -665,13 +882,11 @@ def aggregate_solar_data(df, frequency="M"):
     Returns:
     - DataFrame: Aggregated DataFrame with averages for GHI, DNI, and DHI.
     """
-    if frequency not in ["M", "Y"]:
+    if frequency not in {"M", "Y"}:
         raise ValueError("Frequency must be 'M' (monthly) or 'Y' (yearly).")
 
     # Resample data based on the specified frequency and compute averages
-    aggregated = df[["GHI", "DNI", "DHI"]].resample(frequency).mean()
-
-    return aggregated
+    return df.resample(frequency)[["GHI", "DNI", "DHI"]].mean()
 
 
 def clip_columns_to_range(df, column_ranges):
@@ -687,9 +902,16 @@ def clip_columns_to_range(df, column_ranges):
     Returns:
     - DataFrame: DataFrame with values clipped to specified ranges.
     """
-    for column, (min_val, max_val) in column_ranges.items():
-        if column in df.columns:
-            df[column] = df[column].clip(lower=min_val, upper=max_val)
+    valid = {
+        column: bounds
+        for column, bounds in column_ranges.items()
+        if column in df.columns
+    }
+    if valid:
+        columns = list(valid)
+        lowers = pd.Series({c: b[0] for c, b in valid.items()})
+        uppers = pd.Series({c: b[1] for c, b in valid.items()})
+        df[columns] = df[columns].clip(lower=lowers, upper=uppers, axis=1)
     return df
 
 
@@ -708,24 +930,26 @@ def replace_outliers_with_mean_or_median(df, method="median", threshold=3):
     """
     df_cleaned = df.copy()
 
-    for col in df_cleaned.select_dtypes(include=np.number).columns:
-        # Calculate Z-scores
-        col_mean = df_cleaned[col].mean()
-        col_std = df_cleaned[col].std()
-        z_scores = (df_cleaned[col] - col_mean) / col_std
+    numeric = df_cleaned.select_dtypes(include=np.number)
+    values = numeric.to_numpy(dtype=np.float64)
+
+    # Calculate Z-scores over the contiguous numeric block
+    means = np.nanmean(values, axis=0)
+    stds = np.nanstd(values, axis=0, ddof=1)
+    z_scores = (values - means) / stds
 
-        # Identify outliers
-        outliers = z_scores.abs() > threshold
+    # Identify outliers
+    outliers = np.abs(z_scores) > threshold
 
-        # Replace outliers with mean or median
-        if method == "mean":
-            replacement_value = col_mean
-        elif method == "median":
-            replacement_value = df_cleaned[col].median()
-        else:
-            raise ValueError("Method must be either 'median' or 'mean'")
+    # Replace outliers with mean or median
+    if method == "mean":
+        replacements = means
+    elif method == "median":
+        replacements = np.nanmedian(values, axis=0)
+    else:
+        raise ValueError("Method must be either 'median' or 'mean'")
 
-        df_cleaned.loc[outliers, col] = replacement_value
+    df_cleaned[numeric.columns] = np.where(outliers, replacements, values)
 
     return df_cleaned
 
@@ -741,9 +965,8 @@ def replace_neg_with_zero(df):
     - DataFrame: A DataFrame where all negative values have been
                 replaced with zero.
     """
-    # Replace negative values with zero
-    df_cleaned = df.where(df >= 0, 0)
-    return df_cleaned
+    # Replace negative values with zero in a single clip pass
+    return df.clip(lower=0)
 
 
 def check_negative_values_nighttime(df, nighttime_start=18, nighttime_end=6):
@@ -759,17 +982,14 @@ def check_negative_values_nighttime(df, nighttime_start=18, nighttime_end=6):
                             (default is 6, 6:00 AM).
 
     Returns:
-    - DataFrame: A DataFrame containing rows with negative values, their hour,
-      and a boolean indicating if they occur during nighttime.
+    - bool: True when every row containing a negative value falls within
+      the nighttime window.
     """
-    negative_values = df[(df < 0).any(axis=1)].copy()
-
-    negative_values["Hour"] = negative_values.index.hour
+    values = df.to_numpy()
+    negative_rows = (values < 0).any(axis=1)
 
-    is_nighttime = (negative_values["Hour"] >= nighttime_start) | (
-        negative_values["Hour"] < nighttime_end
-    )
+    hours = df.index.hour.to_numpy()[negative_rows]
 
-    negative_values["Nighttime"] = is_nighttime
+    is_nighttime = (hours >= nighttime_start) | (hours < nighttime_end)
 
-    return all(negative_values[["Hour", "Nighttime"] + list(df.columns)])
+    return bool(is_nighttime.all())